@@ -12,7 +12,7 @@ How to run:
    npm create vite@latest my-finance-app --template react
    cd my-finance-app
 2. Install dependencies:
-   npm install recharts framer-motion
+   npm install recharts framer-motion react-window@1
    (Tailwind: follow tailwind setup for your project OR use CDN in index.html for quick demo)
 3. Replace src/App.jsx with this file, add Tailwind if available, then run:
    npm install
@@ -21,9 +21,10 @@ How to run:
 This file is intentionally self-contained for demo purposes. For production, split components, add tests and secure the categorization/prediction using server-side models or APIs.
 */
 
-import React, { useEffect, useMemo, useState } from "react";
+import React, { useCallback, useEffect, useMemo, useReducer, useRef, useState } from "react";
 import { LineChart, Line, XAxis, YAxis, Tooltip, CartesianGrid, ResponsiveContainer, PieChart, Pie, Cell, BarChart, Bar, Legend } from "recharts";
 import { motion } from "framer-motion";
+import { FixedSizeList, areEqual } from "react-window";
 
 // --- Helper: simple categorizer ---
 const CATEGORY_KEYWORDS = {
@@ -37,16 +38,95 @@ const CATEGORY_KEYWORDS = {
   Others: [""]
 };
 
-function categorizeExpense(description) {
-  const text = (description || "").toLowerCase();
-  for (const [cat, keys] of Object.entries(CATEGORY_KEYWORDS)) {
+const CATEGORIES = Object.keys(CATEGORY_KEYWORDS);
+// keyword lists in category order, without the empty "Others" placeholder
+const CATEGORY_KEYS = CATEGORIES.map((c) => CATEGORY_KEYWORDS[c].filter(Boolean));
+// fallback when no keyword matches
+const TRANSPORT_HINT = /\d+\s?km|journey|trip/i;
+
+// --- Aho-Corasick automaton over all keywords, built once at module load ---
+// goto[s][c]: next state on charCode c (0 = no edge), fail[s]: failure link,
+// output[s]: lowest category index whose keyword ends at s (-1 = none).
+// Keywords are ASCII, so any other charCode simply falls back to the root.
+function buildAhoCorasick(categoryKeys) {
+  const ALPHABET = 128;
+  const goto = [new Int32Array(ALPHABET)];
+  const output = [-1];
+  categoryKeys.forEach((keys, catIdx) => {
     for (const k of keys) {
-      if (!k) continue;
-      if (text.includes(k)) return cat;
+      let s = 0;
+      for (let i = 0; i < k.length; i++) {
+        const c = k.charCodeAt(i);
+        if (!goto[s][c]) {
+          goto[s][c] = goto.length;
+          goto.push(new Int32Array(ALPHABET));
+          output.push(-1);
+        }
+        s = goto[s][c];
+      }
+      if (output[s] < 0 || catIdx < output[s]) output[s] = catIdx;
+    }
+  });
+  // breadth-first pass to wire failure links and inherit outputs from them
+  const fail = new Int32Array(goto.length);
+  const queue = [];
+  for (let c = 0; c < ALPHABET; c++) if (goto[0][c]) queue.push(goto[0][c]);
+  for (let head = 0; head < queue.length; head++) {
+    const r = queue[head];
+    for (let c = 0; c < ALPHABET; c++) {
+      const u = goto[r][c];
+      if (!u) continue;
+      let f = fail[r];
+      while (f && !goto[f][c]) f = fail[f];
+      fail[u] = goto[f][c];
+      const inherited = output[fail[u]];
+      if (inherited >= 0 && (output[u] < 0 || inherited < output[u])) output[u] = inherited;
+      queue.push(u);
+    }
+  }
+  return { goto, fail, output };
+}
+
+const KEYWORD_AC = buildAhoCorasick(CATEGORY_KEYS);
+
+// descriptions repeat a lot ("Coffee", "Fuel"...), so remember results per raw description
+const CATEGORY_CACHE_LIMIT = 2048;
+const categoryCache = new Map();
+
+function categorizeExpense(description) {
+  const hit = categoryCache.get(description);
+  if (hit !== undefined) return hit;
+  const result = matchCategory(description);
+  // FIFO eviction: Map iterates in insertion order, so the first key is the oldest
+  if (categoryCache.size >= CATEGORY_CACHE_LIMIT) categoryCache.delete(categoryCache.keys().next().value);
+  categoryCache.set(description, result);
+  return result;
+}
+
+function matchCategory(description) {
+  const text = description || "";
+  // single linear scan; keep the lowest category index seen so category order still wins.
+  // ASCII case is folded inline instead of allocating a lowercased copy.
+  const { goto, fail, output } = KEYWORD_AC;
+  let best = -1;
+  for (let i = 0, s = 0; i < text.length; i++) {
+    let c = text.charCodeAt(i);
+    if (c >= 65 && c <= 90) c += 32;
+    else if (c >= 128) {
+      s = 0;
+      continue;
+    }
+    while (s && !goto[s][c]) s = fail[s];
+    s = goto[s][c];
+    const hit = output[s];
+    if (hit >= 0 && (best < 0 || hit < best)) {
+      best = hit;
+      if (best === 0) break;
     }
   }
+  if (best >= 0) return CATEGORIES[best];
   // fallback using heuristics
-  if (/\d+\s?km|journey|trip/.test(text)) return "Transport";
+  if (TRANSPORT_HINT.test(text)) return "Transport";
   return "Others";
 }
 
@@ -56,33 +136,222 @@ function linearForecast(values, monthsToForecast = 1) {
   const n = values.length;
   if (n === 0) return null;
   if (n === 1) return values[0];
-  // x: 0..n-1
-  const xs = Array.from({ length: n }, (_, i) => i);
-  const xMean = xs.reduce((a, b) => a + b, 0) / n;
-  const yMean = values.reduce((a, b) => a + b, 0) / n;
-  let num = 0,
-    den = 0;
+  // x: 0..n-1; closed-form least squares from running sums in a single pass
+  let sx = 0,
+    sy = 0,
+    sxy = 0,
+    sxx = 0;
   for (let i = 0; i < n; i++) {
-    num += (xs[i] - xMean) * (values[i] - yMean);
-    den += (xs[i] - xMean) * (xs[i] - xMean);
+    const y = values[i];
+    sx += i;
+    sy += y;
+    sxy += i * y;
+    sxx += i * i;
   }
-  const slope = den === 0 ? 0 : num / den;
-  const intercept = yMean - slope * xMean;
+  const den = n * sxx - sx * sx;
+  const slope = den === 0 ? 0 : (n * sxy - sx * sy) / den;
+  const intercept = (sy - slope * sx) / n;
   // forecast next month(s)
   const nextX = n + (monthsToForecast - 1);
   return intercept + slope * nextX;
 }
 
+// --- Batched regression over a row-major Float64Array (numRows x numCols) ---
+// Same result as linearForecast on each row, but typed arrays in and out, no per-row
+// allocation, and the x sums in closed form so only sum(y) and sum(x*y) are accumulated.
+// An empty row gives NaN (linearForecast's null).
+function forecastRows(matrix, numRows, numCols, monthsToForecast = 1) {
+  const out = new Float64Array(numRows);
+  const n = numCols;
+  const sx = (n * (n - 1)) / 2;
+  const sxx = ((n - 1) * n * (2 * n - 1)) / 6;
+  const den = n * sxx - sx * sx;
+  const nextX = n + (monthsToForecast - 1);
+  for (let r = 0, base = 0; r < numRows; r++, base += n) {
+    if (n < 2) {
+      out[r] = n === 1 ? matrix[base] : NaN;
+      continue;
+    }
+    let sy = 0,
+      sxy = 0;
+    for (let i = 0; i < n; i++) {
+      const y = matrix[base + i];
+      sy += y;
+      sxy += i * y;
+    }
+    const slope = den === 0 ? 0 : (n * sxy - sx * sy) / den;
+    out[r] = (sy - slope * sx) / n + slope * nextX;
+  }
+  return out;
+}
+
+// --- Forecast bundle for the dashboard (also runs inside the forecast worker) ---
+// must stay self-contained apart from the two regressions: the worker is built from their source
+// categories[i] owns row i of matrix; matrix has one column per entry of totalSeries
+function computeForecasts(categories, matrix, totalSeries) {
+  const catForecast = new Map();
+  const projected = forecastRows(matrix, categories.length, totalSeries.length, 1);
+  for (let i = 0; i < categories.length; i++) {
+    catForecast.set(categories[i], Math.max(0, Math.round(projected[i] || 0)));
+  }
+  const totalForecast = Math.max(0, Math.round(linearForecast(totalSeries, 1) || 0));
+  return { totalForecast, catForecast };
+}
+
+// true when two bundles would render identically, so the old one can be kept
+function sameForecasts(a, b) {
+  if (a.totalForecast !== b.totalForecast) return false;
+  if (a.catForecast.size !== b.catForecast.size) return false;
+  const kb = Array.from(b.catForecast.keys());
+  let i = 0;
+  for (const [k, v] of a.catForecast) {
+    if (k !== kb[i++] || v !== b.catForecast.get(k)) return false;
+  }
+  return true;
+}
+
+// how long the worker may leave the current input unanswered before forecasts move to the main thread
+const FORECAST_REPLY_TIMEOUT = 2000;
+
+// inline Blob worker so the app stays a single file; null where workers are unavailable
+function createForecastWorker() {
+  if (typeof Worker === "undefined" || typeof Blob === "undefined") return null;
+  const source = `${linearForecast}\n${forecastRows}\n${computeForecasts}\nonmessage = ({ data }) => postMessage({ seq: data.seq, result: ${computeForecasts.name}(data.categories, data.matrix, data.totalSeries) });`;
+  const url = URL.createObjectURL(new Blob([source], { type: "text/javascript" }));
+  try {
+    return new Worker(url);
+  } catch (e) {
+    return null;
+  } finally {
+    // blob URLs are resolved when the Worker is constructed, so it is safe to revoke now
+    URL.revokeObjectURL(url);
+  }
+}
+
 // --- Utilities ---
 function formatCurrency(n) {
   return (typeof n === "number" ? n : 0).toLocaleString(undefined, { style: "currency", currency: "INR", maximumFractionDigits: 0 });
 }
 
+// trailing-edge debounce; debounced.flush() runs a pending call immediately
+function debounce(fn, wait) {
+  let timer = null;
+  const run = () => {
+    clearTimeout(timer);
+    timer = null;
+    fn();
+  };
+  const debounced = () => {
+    clearTimeout(timer);
+    timer = setTimeout(run, wait);
+  };
+  debounced.flush = () => {
+    if (timer !== null) run();
+  };
+  return debounced;
+}
+
+// local-date display that agrees with monthKey: new Date("YYYY-MM-DD") is UTC midnight,
+// which shows as the previous day west of UTC, so ISO dates are built from their parts
+function displayDate(date) {
+  const iso = typeof date === "string" && /^(\d{4})-(\d{2})-(\d{2})/.exec(date);
+  if (iso) return new Date(Number(iso[1]), Number(iso[2]) - 1, Number(iso[3])).toLocaleDateString();
+  return new Date(date).toLocaleDateString();
+}
+
 function monthKey(date) {
+  // fast path: ISO "YYYY-MM-DD" strings (date inputs, stored rows) need no Date parse
+  if (typeof date === "string" && /^\d{4}-\d{2}/.test(date)) return date.slice(0, 7);
   const d = new Date(date);
   return `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, "0")}`;
 }
 
+// --- Running aggregates, kept in step with the expense list ---
+// byMonth / byCategory: Map<key, { total, count }>
+// byCatMonth: Map<category, Map<month, { total, count }>>
+// count lets a bucket disappear once its last expense is removed, even for 0-amount rows.
+function emptyTotals() {
+  return { byMonth: new Map(), byCategory: new Map(), byCatMonth: new Map() };
+}
+
+// in-place bucket update; only ever called on maps applyExpenses has just copied
+function bumpTotal(map, key, amount, sign) {
+  const prev = map.get(key) || { total: 0, count: 0 };
+  const count = prev.count + sign;
+  if (count <= 0) map.delete(key);
+  else map.set(key, { total: prev.total + sign * amount, count });
+}
+
+// add (sign 1) or remove (sign -1) a batch of rows; copies each touched Map once per batch
+// and never mutates the previous totals, so React sees new identities
+function applyExpenses(totals, rows, sign) {
+  const byMonth = new Map(totals.byMonth);
+  const byCategory = new Map(totals.byCategory);
+  const byCatMonth = new Map(totals.byCatMonth);
+  const copied = new Set();
+  for (const e of rows) {
+    bumpTotal(byMonth, e._monthKey, e.amount, sign);
+    bumpTotal(byCategory, e.category, e.amount, sign);
+    if (!copied.has(e.category)) {
+      byCatMonth.set(e.category, new Map(byCatMonth.get(e.category)));
+      copied.add(e.category);
+    }
+    bumpTotal(byCatMonth.get(e.category), e._monthKey, e.amount, sign);
+  }
+  for (const c of copied) if (!byCatMonth.get(c).size) byCatMonth.delete(c);
+  return { byMonth, byCategory, byCatMonth };
+}
+
+// full build, used once when the list is loaded
+function aggregateExpenses(expenses) {
+  return applyExpenses(emptyTotals(), expenses, 1);
+}
+
+// attach per-row derived fields once, so renders and aggregates never reparse the date
+function prepareExpense(e) {
+  return {
+    ...e,
+    category: e.category || categorizeExpense(e.description),
+    _monthKey: monthKey(e.date),
+    _displayDate: displayDate(e.date)
+  };
+}
+
+// derived "_" fields are rebuilt by prepareExpense on load, so they are left out of storage
+function stripDerivedFields(key, value) {
+  return key[0] === "_" ? undefined : value;
+}
+
+function initExpenses(expenses) {
+  const rows = expenses.map(prepareExpense);
+  // stored ids may run ahead of the clock (batched adds), so new ids must start past them
+  for (const r of rows) if (typeof r.id === "number" && r.id > lastExpenseId) lastExpenseId = r.id;
+  return { expenses: rows, totals: aggregateExpenses(rows) };
+}
+
+function expensesReducer(state, action) {
+  switch (action.type) {
+    case "add":
+      if (!action.expenses.length) return state;
+      return { expenses: [...action.expenses, ...state.expenses], totals: applyExpenses(state.totals, action.expenses, 1) };
+    case "remove": {
+      const row = state.expenses.find((x) => x.id === action.id);
+      if (!row) return state;
+      return { expenses: state.expenses.filter((x) => x !== row), totals: applyExpenses(state.totals, [row], -1) };
+    }
+    default:
+      return state;
+  }
+}
+
+// ids stay close to Date.now() (older sessions used it) but never repeat, even within a millisecond;
+// initExpenses raises lastExpenseId past every loaded id so reloads can't reuse one
+let lastExpenseId = 0;
+function nextExpenseId() {
+  lastExpenseId = Math.max(lastExpenseId + 1, Date.now());
+  return lastExpenseId;
+}
+
 // sample starter data
 const SAMPLE_EXPENSES = [
   { id: 1, date: "2025-05-02", amount: 4200, description: "Walmart Groceries" },
@@ -98,12 +367,12 @@ const SAMPLE_EXPENSES = [
 const COLORS = ["#4dc9f6", "#f67019", "#f53794", "#537bc4", "#acc236", "#166a8f", "#00a950", "#58595b"];
 
 export default function App() {
-  const [expenses, setExpenses] = useState(() => {
+  const [{ expenses, totals }, dispatch] = useReducer(expensesReducer, undefined, () => {
     try {
       const raw = localStorage.getItem("ai_fin_expenses");
-      return raw ? JSON.parse(raw) : SAMPLE_EXPENSES;
+      return initExpenses(raw ? JSON.parse(raw) : SAMPLE_EXPENSES);
     } catch (e) {
-      return SAMPLE_EXPENSES;
+      return initExpenses(SAMPLE_EXPENSES);
     }
   });
   const [budget, setBudget] = useState(() => {
@@ -115,66 +384,152 @@ export default function App() {
     return raw ? JSON.parse(raw) : { name: "Emergency Fund", target: 50000, saved: 12000 };
   });
 
-  useEffect(() => localStorage.setItem("ai_fin_expenses", JSON.stringify(expenses)), [expenses]);
-  useEffect(() => localStorage.setItem("ai_fin_budget", JSON.stringify(budget)), [budget]);
-  useEffect(() => localStorage.setItem("ai_fin_goal", JSON.stringify(goal)), [goal]);
-
-  // enrich expenses with categories
-  const enriched = useMemo(() => {
-    return expenses.map((e) => ({ ...e, category: e.category || categorizeExpense(e.description) }));
-  }, [expenses]);
-
-  // monthly totals per monthKey
+  // persistence: collect changed slices and write them together once edits settle
+  // lastWritten[key] = { value, json } of the last write, so unchanged slices are skipped:
+  // same reference -> no stringify at all, same JSON -> no setItem
+  const pending = useRef({});
+  const lastWritten = useRef({});
+  const flush = useMemo(
+    () =>
+      debounce(() => {
+        // a slice whose write fails (e.g. QuotaExceededError) stays pending and is retried on the next flush
+        const failed = {};
+        for (const [k, v] of Object.entries(pending.current)) {
+          const last = lastWritten.current[k];
+          if (last && last.value === v) continue;
+          const json = JSON.stringify(v, k === "ai_fin_expenses" ? stripDerivedFields : undefined);
+          if (!last || last.json !== json) {
+            try {
+              localStorage.setItem(k, json);
+            } catch (err) {
+              console.warn(`Could not save ${k}`, err);
+              failed[k] = v;
+              continue;
+            }
+          }
+          // only recorded once the write has actually happened
+          lastWritten.current[k] = { value: v, json };
+        }
+        pending.current = failed;
+      }, 250),
+    []
+  );
+  // beforeunload is often skipped (mobile Safari, back/forward cache), so also save when
+  // the page is hidden or cached; these are the last reliable points before it may be killed
+  useEffect(() => {
+    const onVisibilityChange = () => {
+      if (document.visibilityState === "hidden") flush.flush();
+    };
+    window.addEventListener("beforeunload", flush.flush);
+    window.addEventListener("pagehide", flush.flush);
+    document.addEventListener("visibilitychange", onVisibilityChange);
+    return () => {
+      window.removeEventListener("beforeunload", flush.flush);
+      window.removeEventListener("pagehide", flush.flush);
+      document.removeEventListener("visibilitychange", onVisibilityChange);
+      flush.flush();
+    };
+  }, [flush]);
+
+  useEffect(() => {
+    pending.current.ai_fin_expenses = expenses;
+    flush();
+  }, [expenses, flush]);
+  useEffect(() => {
+    pending.current.ai_fin_budget = budget;
+    flush();
+  }, [budget, flush]);
+  useEffect(() => {
+    pending.current.ai_fin_goal = goal;
+    flush();
+  }, [goal, flush]);
+
+  // monthly totals per monthKey (expenses already carry their category, see initExpenses)
   const monthlyTotals = useMemo(() => {
-    const map = {};
-    for (const e of enriched) {
-      const k = monthKey(e.date);
-      map[k] = (map[k] || 0) + e.amount;
-    }
     // sort keys ascending
-    const rows = Object.keys(map).sort().map((k) => ({ month: k, total: Math.round(map[k]) }));
-    return rows;
-  }, [enriched]);
+    return Array.from(totals.byMonth, ([month, b]) => ({ month, total: Math.round(b.total) })).sort((a, b) => (a.month < b.month ? -1 : 1));
+  }, [totals.byMonth]);
 
   // category-wise totals
   const categoryTotals = useMemo(() => {
-    const map = {};
-    for (const e of enriched) {
-      map[e.category] = (map[e.category] || 0) + e.amount;
-    }
-    return Object.entries(map).map(([name, value]) => ({ name, value }));
-  }, [enriched]);
+    return Array.from(totals.byCategory, ([name, b]) => ({ name, value: b.total }));
+  }, [totals.byCategory]);
+
+  // category x month layout: BarChart rows and the forecast matrix in one walk
+  const catMonthly = useMemo(() => layoutCategoryMonths(totals.byCatMonth, monthlyTotals), [totals.byCatMonth, monthlyTotals]);
 
   // predictive analytics: forecast next month total & per-category
-  const forecasts = useMemo(() => {
-    // prepare time series per month
-    const months = monthlyTotals.map((r) => r.month);
-    const monthIndex = months.reduce((acc, m, i) => ((acc[m] = i), acc), {});
-    // build category-time matrix
-    const categories = Array.from(new Set(enriched.map((e) => e.category)));
-    const catSeries = {};
-    for (const c of categories) catSeries[c] = Array(months.length).fill(0);
-    for (const e of enriched) {
-      const m = monthKey(e.date);
-      const idx = monthIndex[m];
-      if (idx === undefined) continue;
-      catSeries[e.category][idx] += e.amount;
-    }
-    const catForecast = {};
-    for (const c of categories) {
-      catForecast[c] = Math.max(0, Math.round(linearForecast(catSeries[c], 1) || 0));
-    }
-    const totalSeries = monthlyTotals.map((r) => r.total);
-    const totalForecast = Math.max(0, Math.round(linearForecast(totalSeries, 1) || 0));
-    return { totalForecast, catForecast };
-  }, [monthlyTotals, enriched]);
+  // computed in a worker off the main thread; the first render uses a synchronous pass
+  const forecastInput = useMemo(
+    () => ({ categories: catMonthly.categories, matrix: catMonthly.matrix, totalSeries: monthlyTotals.map((r) => r.total) }),
+    [catMonthly, monthlyTotals]
+  );
+  const [forecasts, setForecasts] = useState(() => computeForecasts(forecastInput.categories, forecastInput.matrix, forecastInput.totalSeries));
+  const forecastWorker = useRef(null);
+  const forecastSeq = useRef(0);
+  const forecastLatest = useRef(forecastInput);
+  // keep the previous bundle when nothing visible changed, so alerts and the cards don't refire
+  const updateForecasts = (next) => setForecasts((prev) => (sameForecasts(prev, next) ? prev : next));
+  useEffect(() => {
+    const worker = createForecastWorker();
+    if (!worker) return;
+    let replyTimer = null;
+    // the worker failed (CSP block, error in the generated source) or never answered:
+    // drop it and compute the latest input on the main thread from now on
+    const fallBack = () => {
+      clearTimeout(replyTimer);
+      replyTimer = null;
+      worker.terminate();
+      if (forecastWorker.current === handle) forecastWorker.current = null;
+      const input = forecastLatest.current;
+      updateForecasts(computeForecasts(input.categories, input.matrix, input.totalSeries));
+    };
+    // drop replies to inputs that have since been superseded
+    worker.onmessage = ({ data }) => {
+      if (data.seq !== forecastSeq.current) return;
+      clearTimeout(replyTimer);
+      replyTimer = null;
+      updateForecasts(data.result);
+    };
+    worker.onerror = (e) => {
+      e.preventDefault();
+      fallBack();
+    };
+    worker.onmessageerror = fallBack;
+    const handle = {
+      post(input) {
+        // started by the oldest unanswered post, so a stalled worker is noticed even while inputs keep coming
+        if (replyTimer === null) replyTimer = setTimeout(fallBack, FORECAST_REPLY_TIMEOUT);
+        worker.postMessage({ seq: forecastSeq.current, ...input });
+      }
+    };
+    forecastWorker.current = handle;
+    return () => {
+      clearTimeout(replyTimer);
+      worker.terminate();
+      forecastWorker.current = null;
+    };
+  }, []);
+  useEffect(() => {
+    forecastLatest.current = forecastInput;
+    ++forecastSeq.current;
+    if (forecastWorker.current) forecastWorker.current.post(forecastInput);
+    else updateForecasts(computeForecasts(forecastInput.categories, forecastInput.matrix, forecastInput.totalSeries));
+  }, [forecastInput]);
+
+  // Pie slices, keyed by category so React reconciles a stable children array
+  const pieCells = useMemo(() => categoryTotals.map((entry, index) => <Cell key={entry.name} fill={COLORS[index % COLORS.length]} />), [categoryTotals]);
+
+  // category history for the stacked BarChart, plus the category list for its <Bar>s
+  const catHistory = catMonthly.rows;
+  const catKeys = catMonthly.categories;
 
   // budget alerts
   const alerts = useMemo(() => {
     const alertsList = [];
     // projected month: current month key
     // compare forecasts per category
-    for (const [cat, proj] of Object.entries(forecasts.catForecast || {})) {
+    for (const [cat, proj] of forecasts.catForecast) {
       const limit = budget.byCategory?.[cat];
       if (limit && proj > limit) alertsList.push({ type: "category", category: cat, projected: proj, limit });
     }
@@ -182,17 +537,20 @@ export default function App() {
     return alertsList;
   }, [forecasts, budget]);
 
-  // add expense
-  function addExpense({ date, amount, description }) {
-    const id = Date.now();
-    const category = categorizeExpense(description);
-    setExpenses((s) => [{ id, date, amount: Number(amount), description, category }, ...s]);
+  // add expenses in one update (e.g. an import): one render, one debounced persist
+  function addExpenses(rows) {
+    const prepared = rows.map(({ date, amount, description }) => prepareExpense({ id: nextExpenseId(), date, amount: Number(amount), description }));
+    dispatch({ type: "add", expenses: prepared });
   }
 
-  function removeExpense(id) {
-    setExpenses((s) => s.filter((x) => x.id !== id));
+  function addExpense(row) {
+    addExpenses([row]);
   }
 
+  const removeExpense = useCallback((id) => dispatch({ type: "remove", id }), []);
+
+  const expenseListData = useMemo(() => ({ expenses, onRemove: removeExpense }), [expenses, removeExpense]);
+
   // quick stats
   const totalSpent = monthlyTotals.length ? monthlyTotals[monthlyTotals.length - 1].total : 0;
 
@@ -219,20 +577,16 @@ export default function App() {
             <hr className="my-4" />
 
             <h3 className="font-semibold mb-2">Recent Expenses</h3>
-            <div className="space-y-2 max-h-96 overflow-auto">
-              {enriched.map((e) => (
-                <motion.div key={e.id} initial={{ opacity: 0, y: 6 }} animate={{ opacity: 1, y: 0 }} className="flex items-center justify-between border p-2 rounded">
-                  <div>
-                    <div className="font-medium">{e.description}</div>
-                    <div className="text-xs text-gray-500">{new Date(e.date).toLocaleDateString()} • {e.category}</div>
-                  </div>
-                  <div className="text-right">
-                    <div className="font-semibold">{formatCurrency(e.amount)}</div>
-                    <button onClick={() => removeExpense(e.id)} className="text-xs text-red-500 hover:underline mt-1">Remove</button>
-                  </div>
-                </motion.div>
-              ))}
-            </div>
+            {/* windowed: only the rows in view (plus overscan) are mounted */}
+            <FixedSizeList
+              height={Math.min(EXPENSE_LIST_HEIGHT, expenses.length * EXPENSE_ROW_HEIGHT)}
+              itemSize={EXPENSE_ROW_HEIGHT}
+              itemCount={expenses.length}
+              itemData={expenseListData}
+              itemKey={(index, data) => data.expenses[index].id}
+            >
+              {ExpenseRow}
+            </FixedSizeList>
           </section>
 
           {/* Middle column: charts */}
@@ -260,9 +614,7 @@ export default function App() {
                   <ResponsiveContainer>
                     <PieChart>
                       <Pie data={categoryTotals} dataKey="value" nameKey="name" innerRadius={40} outerRadius={80} label>
-                        {categoryTotals.map((entry, index) => (
-                          <Cell key={`cell-${index}`} fill={COLORS[index % COLORS.length]} />
-                        ))}
+                        {pieCells}
                       </Pie>
                       <Tooltip />
                     </PieChart>
@@ -274,17 +626,15 @@ export default function App() {
                 <h3 className="font-semibold mb-2">Category Spending History</h3>
                 <div style={{ width: "100%", height: 260 }}>
                   <ResponsiveContainer>
-                    <BarChart data={buildCategoryHistory(enriched)}>
+                    <BarChart data={catHistory}>
                       <CartesianGrid strokeDasharray="3 3" />
                       <XAxis dataKey="month" />
                       <YAxis />
                       <Tooltip />
                       <Legend />
-                      {Object.keys(buildCategoryHistory(enriched)[0] || {})
-                        .filter((k) => k !== "month")
-                        .map((cat, idx) => (
-                          <Bar key={cat} dataKey={cat} stackId="a" fill={COLORS[idx % COLORS.length]} />
-                        ))}
+                      {catKeys.map((cat, idx) => (
+                        <Bar key={cat} dataKey={cat} stackId="a" fill={COLORS[idx % COLORS.length]} />
+                      ))}
                     </BarChart>
                   </ResponsiveContainer>
                 </div>
@@ -306,7 +656,7 @@ export default function App() {
             </div>
 
             <div className="mt-3 grid grid-cols-1 md:grid-cols-3 gap-4">
-              {Object.entries(forecasts.catForecast || {}).map(([cat, val], i) => (
+              {Array.from(forecasts.catForecast, ([cat, val], i) => (
                 <div key={cat} className="p-3 border rounded">
                   <div className="text-sm text-gray-600">{cat}</div>
                   <div className="font-bold text-xl">{formatCurrency(val)}</div>
@@ -351,6 +701,41 @@ export default function App() {
   );
 }
 
+// --- Recent expenses list row (rendered by react-window) ---
+const EXPENSE_LIST_HEIGHT = 384; // matches the old max-h-96 container
+// 62px card (2px border + 16px padding + 44px amount/Remove column) + 8px gap;
+// the card text is single-line (truncate) so every row fits this fixed size
+const EXPENSE_ROW_HEIGHT = 70;
+const ANIMATED_ROWS = 10; // entrance animation only for the rows near the top
+// shared motion props: fresh literals each render would defeat Framer Motion's prop checks
+const ROW_INIT = { opacity: 0, y: 6 };
+const ROW_ANIM = { opacity: 1, y: 0 };
+
+// areEqual compares react-window's style prop by value, so scrolling doesn't re-render every row
+const ExpenseRow = React.memo(function ExpenseRow({ index, style, data }) {
+  return (
+    <div style={style} className="pb-2">
+      <ExpenseCard e={data.expenses[index]} animateIn={index < ANIMATED_ROWS} onRemove={data.onRemove} />
+    </div>
+  );
+}, areEqual);
+
+// list data changes on every add/remove; the card itself only re-renders when its row does
+const ExpenseCard = React.memo(function ExpenseCard({ e, animateIn, onRemove }) {
+  return (
+    <motion.div initial={animateIn ? ROW_INIT : false} animate={ROW_ANIM} className="flex items-center justify-between gap-2 border p-2 rounded h-full">
+      <div className="min-w-0">
+        <div className="font-medium truncate" title={e.description}>{e.description}</div>
+        <div className="text-xs text-gray-500 truncate">{e._displayDate} • {e.category}</div>
+      </div>
+      <div className="text-right shrink-0">
+        <div className="font-semibold">{formatCurrency(e.amount)}</div>
+        <button onClick={() => onRemove(e.id)} className="block ml-auto text-xs text-red-500 hover:underline mt-1">Remove</button>
+      </div>
+    </motion.div>
+  );
+});
+
 // --- Add expense form ---
 function AddExpenseForm({ onAdd }) {
   const [date, setDate] = useState(() => new Date().toISOString().slice(0, 10));
@@ -370,26 +755,26 @@ function AddExpenseForm({ onAdd }) {
   );
 }
 
-// --- Build category history across months for BarChart ---
-function buildCategoryHistory(expenses) {
-  // gather month keys
-  const monthsSet = new Set();
-  for (const e of expenses) monthsSet.add(monthKey(e.date));
-  const months = Array.from(monthsSet).sort();
-  const categories = Array.from(new Set(expenses.map((e) => e.category)));
-  const rows = months.map((m) => {
-    const row = { month: m };
-    for (const c of categories) row[c] = 0;
-    return row;
-  });
-  const monthIndex = months.reduce((acc, m, i) => ((acc[m] = i), acc), {});
-  for (const e of expenses) {
-    const m = monthKey(e.date);
-    const idx = monthIndex[m];
-    if (idx === undefined) continue;
-    rows[idx][e.category] = (rows[idx][e.category] || 0) + e.amount;
+// --- Lay out category totals on the month axis ---
+// rows: BarChart data ({ month, [category]: total })
+// matrix: Float64Array of categories x months (row-major), categories: row order of matrix
+function layoutCategoryMonths(byCatMonth, monthlyTotals) {
+  const rows = monthlyTotals.map(({ month }) => ({ month }));
+  const numMonths = rows.length;
+  const matrix = new Float64Array(byCatMonth.size * numMonths);
+  const categories = [];
+  let catIdx = 0;
+  for (const [c, inner] of byCatMonth) {
+    const base = catIdx * numMonths;
+    for (let i = 0; i < numMonths; i++) {
+      const v = inner.get(rows[i].month)?.total || 0;
+      matrix[base + i] = v;
+      rows[i][c] = v;
+    }
+    categories.push(c);
+    catIdx++;
   }
-  return rows;
+  return { rows, matrix, categories };
 }
 
 function BudgetEditor({ budget, setBudget, goal, setGoal }) {